@@ -2,25 +2,93 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.logger import get_logger
+from app.logger import get_logger, preview
 from app.services import stream_graph
 from app.services.langgraph import DEFAULT_MAX_TURNS
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# 프록시(nginx 등)가 부분 응답을 모아두지 않고 매 이벤트마다 바로 흘려보내도록 한다.
+STREAM_HEADERS = {
+    "X-Accel-Buffering": "no",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+STREAM_QUEUE_SIZE = 16
+_STREAM_DONE = object()
 
-def _preview(text: str, limit: int = 80) -> str:
-    """로그 출력을 위해 문자열을 요약한다."""
 
-    compact = " ".join(text.split())
-    return compact[:limit] + ("…" if len(compact) > limit else "")
+def _encode_event(event: dict) -> bytes:
+    """스트림 이벤트를 NDJSON 한 줄(bytes)로 직렬화한다."""
+
+    return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _encode_sse_event(event: dict) -> bytes:
+    """스트림 이벤트를 `event:`/`data:` 필드를 가진 SSE 프레임으로 직렬화한다.
+
+    엔드포인트가 POST 전용이므로 클라이언트는 `EventSource` 대신 fetch 기반 SSE 리더로 읽어야 한다.
+    """
+
+    event_type = str(event.get("type") or "partial")
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(event) + b"\n\n"
+
+
+async def _buffered(
+    events: AsyncGenerator[dict[str, Any], None], maxsize: int = STREAM_QUEUE_SIZE
+) -> AsyncIterator[dict[str, Any]]:
+    """생산자(LangGraph)와 소비자(HTTP 전송) 사이에 bounded 큐를 두어 서로를 기다리지 않게 한다.
+
+    클라이언트 연결이 끊겨 소비자가 종료되면 생산자를 취소하고 `events`를 즉시 `aclose()`해
+    LangGraph 스트림과 LLM HTTP 연결이 GC 시점까지 남아 있지 않도록 한다.
+
+    Args:
+        events: LangGraph 이벤트를 생성하는 비동기 제너레이터.
+        maxsize: 전송 대기 중인 이벤트의 최대 개수. 가득 차면 생산자가 대기한다.
+
+    Yields:
+        dict[str, Any]: 원본 순서를 유지한 이벤트.
+
+    Raises:
+        Exception: 생산자에서 발생한 예외를 소비자 쪽으로 그대로 전달한다.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+
+    async def produce() -> None:
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        finally:
+            await events.aclose()
+        await queue.put(_STREAM_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
 
 
 class AskRequest(BaseModel):
@@ -30,6 +98,8 @@ class AskRequest(BaseModel):
     turn: int | None = None
     max_turns: int | None = None
     history: list[dict[str, str]] | None = None
+    first_only: bool = False
+    thread_id: str | None = None
 
 
 @router.get("/health")
@@ -44,14 +114,18 @@ async def health():
 
 
 @router.post("/api/ask")
-async def ask_question(payload: AskRequest):
+async def ask_question(payload: AskRequest, request: Request, include_messages: bool = False):
     """LangGraph 워크플로우를 스트림 형태로 실행한다.
 
     Args:
         payload: 질문 문자열을 담은 요청 본문.
+        request: `Accept` 헤더로 스트림 포맷을 결정하기 위한 원본 요청.
+        include_messages: `True`이면 summary 이벤트에 전체 메시지 목록을 포함한다.
+            기본값은 메시지 수(`message_count`)만 전달해 partial 이벤트로 이미 보낸 내용을 재전송하지 않는다.
 
     Returns:
-        StreamingResponse: partial/summary 이벤트가 줄 단위 JSON으로 전달되는 스트림 응답.
+        StreamingResponse: run/token/partial/primary/summary 이벤트가 전달되는 스트림 응답.
+            기본은 줄 단위 JSON(NDJSON)이며, `Accept: text/event-stream` 요청에는 SSE로 응답한다.
     """
 
     question = payload.question.strip()
@@ -64,31 +138,44 @@ async def ask_question(payload: AskRequest):
     if turn < 1:
         turn = 1
 
-    logger.info("질문 수신: %s", _preview(question))
+    use_sse = "text/event-stream" in request.headers.get("accept", "")
+    encode = _encode_sse_event if use_sse else _encode_event
+    logger.info("질문 수신: %s", preview(question))
 
     async def response_stream():
         answers = {}
         api_status = {}
         durations_ms: dict[str, int] = {}
         messages = [{"role": "user", "content": question}]
-        seen_messages = {("user", question)}
+        seen_messages: set[int | str] = {hash(("user", question))}
         completion_order: list[str] = []
         errors: list[dict[str, str | None]] = []
+        thread_id = payload.thread_id
+        primary_answer: dict[str, Any] | None = None
 
         def extend_messages(new_messages: list[dict[str, str]] | None):
             for message in new_messages or []:
-                role = str(message.get("role"))
-                content = str(message.get("content"))
-                key = (role, content)
+                key = message.get("id") or hash((message.get("role"), message.get("content")))
                 if key in seen_messages:
                     continue
                 seen_messages.add(key)
-                messages.append({"role": role, "content": content})
+                if include_messages:
+                    messages.append({"role": str(message.get("role")), "content": str(message.get("content"))})
 
         try:
-            async for event in stream_graph(question, turn=turn, max_turns=max_turns, history=history):
+            events = stream_graph(
+                question,
+                turn=turn,
+                max_turns=max_turns,
+                history=history,
+                first_only=payload.first_only,
+                thread_id=payload.thread_id,
+            )
+            async for event in _buffered(events):
                 event_type = event.get("type", "partial")
-                if event_type == "partial":
+                if event_type == "run":
+                    thread_id = event.get("thread_id")
+                elif event_type == "partial":
                     model = event.get("model")
                     if model:
                         if model not in completion_order:
@@ -116,7 +203,15 @@ async def ask_question(payload: AskRequest):
                             "model": event.get("model"),
                         }
                     )
-                yield json.dumps(event, ensure_ascii=False) + "\n"
+                yield encode(event)
+                if event_type == "partial" and primary_answer is None and event.get("model") and event.get("answer"):
+                    # 가장 먼저 답변한 모델을 즉시 알려 나머지 모델을 기다리지 않고 답을 보여줄 수 있게 한다.
+                    primary_answer = {
+                        "model": event.get("model"),
+                        "answer": event.get("answer"),
+                        "status": event.get("status"),
+                    }
+                    yield encode({"type": "primary", **primary_answer, "turn": turn})
         except Exception as exc:  # pragma: no cover
             error_event = {"type": "error", "message": str(exc), "node": None, "model": None}
             errors.append(
@@ -127,18 +222,9 @@ async def ask_question(payload: AskRequest):
                 }
             )
             logger.error("응답 스트림 처리 중 오류: %s", exc)
-            yield json.dumps(error_event, ensure_ascii=False) + "\n"
+            yield encode(error_event)
         finally:
-            primary_model = next((model for model in completion_order if answers.get(model)), None)
-            primary_answer = (
-                {
-                    "model": primary_model,
-                    "answer": answers.get(primary_model),
-                    "status": api_status.get(primary_model),
-                }
-                if primary_model
-                else None
-            )
+            primary_model = primary_answer["model"] if primary_answer else None
             summary = {
                 "type": "summary",
                 "result": {
@@ -146,16 +232,20 @@ async def ask_question(payload: AskRequest):
                     "answers": answers,
                     "api_status": api_status,
                     "durations_ms": durations_ms,
-                    "messages": messages,
+                    "message_count": len(seen_messages),
                     "order": completion_order,
                     "primary_model": primary_model,
                     "primary_answer": primary_answer,
                     "errors": errors,
                     "turn": turn,
                     "max_turns": max_turns,
+                    "thread_id": thread_id,
                 },
             }
+            if include_messages:
+                summary["result"]["messages"] = messages
             logger.info("요약 응답 전송 - 완료 모델 수: %d, 오류 수: %d", len(answers), len(errors))
-            yield json.dumps(summary, ensure_ascii=False) + "\n"
+            yield encode(summary)
 
-    return StreamingResponse(response_stream(), media_type="application/json")
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    return StreamingResponse(response_stream(), media_type=media_type, headers=STREAM_HEADERS)
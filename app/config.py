@@ -3,13 +3,70 @@
 from __future__ import annotations
 
 import os
+import re
 from dataclasses import dataclass
-from functools import lru_cache
 from typing import Literal
 
 from dotenv import load_dotenv
 
-load_dotenv()
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+_PROVIDER_CONCURRENCY_RE = re.compile(r"^([A-Z0-9]+)_MAX_CONCURRENCY$")
+
+
+def load_env() -> None:
+    """`.env` 파일을 프로세스 트리에서 한 번만 읽는다.
+
+    운영 환경(`APP_ENV=prod`)에서는 환경변수가 이미 주입되어 있다고 보고 파일 탐색을 건너뛴다.
+    읽은 뒤에는 `DOTENV_LOADED=1`을 설정해 자식 프로세스/재임포트에서 다시 탐색하지 않는다.
+    """
+    if os.getenv("APP_ENV") == "prod" or os.getenv("DOTENV_LOADED"):
+        return
+    load_dotenv()
+    os.environ["DOTENV_LOADED"] = "1"
+
+
+load_env()
+
+
+def _parse_positive_int(name: str, raw: str | None) -> int | None:
+    """환경변수 값을 1 이상의 정수로 해석한다. 비어 있으면 `None`, 잘못된 값이면 경고 후 `None`."""
+
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning("%s=%r 값이 1 이상의 정수가 아니어서 무시합니다.", name, raw)
+        return None
+    return value
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """환경변수를 1 이상의 정수로 읽고, 없거나 잘못된 값이면 기본값을 사용한다."""
+
+    value = _parse_positive_int(name, os.getenv(name))
+    return default if value is None else value
+
+
+def _provider_concurrency_overrides(environ: dict[str, str]) -> tuple[tuple[str, int], ...]:
+    """`<LABEL>_MAX_CONCURRENCY` 환경변수를 `(소문자 라벨, 상한)` 쌍으로 모은다. 잘못된 값은 무시한다.
+
+    `Settings`가 해시 가능하도록 dict 대신 정렬된 튜플로 반환한다.
+    """
+
+    overrides: dict[str, int] = {}
+    for name, raw in environ.items():
+        match = _PROVIDER_CONCURRENCY_RE.match(name)
+        if match is None or match.group(1) == "LLM":
+            continue
+        value = _parse_positive_int(name, raw)
+        if value is not None:
+            overrides[match.group(1).lower()] = value
+    return tuple(sorted(overrides.items()))
 
 
 @dataclass(frozen=True)
@@ -23,6 +80,21 @@ class Settings:
 
     env: Literal["local", "test", "prod"] = "local"
     langsmith_project: str = "API-LangGraph-Test"
+    langsmith_tracing: bool = False
+
+    llm_cache_ttl_s: int = 3600
+    llm_cache_maxsize: int = 1024
+    redis_url: str | None = None
+    checkpoint_redis_url: str | None = None
+    checkpoint_ttl_min: int = 60
+    llm_max_concurrency: int = 32
+    llm_provider_max_concurrency: int = 8
+    llm_provider_concurrency: tuple[tuple[str, int], ...] = ()
+    llm_timeout_s: float = 30.0
+    llm_max_retries: int = 2
+    llm_max_output_tokens: int | None = None
+    llm_prewarm: bool = False
+    llm_deadline_s: float = 60.0
 
     @staticmethod
     def from_env() -> Settings:
@@ -39,15 +111,31 @@ class Settings:
             streamlit_headless=os.getenv("STREAMLIT_SERVER_HEADLESS", "true").lower() == "true",
             env=os.getenv("APP_ENV", "local"),  # type: ignore[assignment]
             langsmith_project=os.getenv("LANGSMITH_PROJECT", "API-LangGraph-Test"),
+            langsmith_tracing=os.getenv("LANGSMITH_TRACING", "false").lower() in {"1", "true"},
+            llm_cache_ttl_s=int(os.getenv("LLM_CACHE_TTL", "3600")),
+            llm_cache_maxsize=int(os.getenv("LLM_CACHE_MAXSIZE", "1024")),
+            redis_url=os.getenv("REDIS_URL") or None,
+            checkpoint_redis_url=os.getenv("CHECKPOINT_REDIS_URL") or None,
+            checkpoint_ttl_min=_positive_int_env("CHECKPOINT_TTL_MINUTES", 60),
+            llm_max_concurrency=_positive_int_env("LLM_MAX_CONCURRENCY", 32),
+            llm_provider_max_concurrency=_positive_int_env("LLM_PROVIDER_MAX_CONCURRENCY", 8),
+            llm_provider_concurrency=_provider_concurrency_overrides(dict(os.environ)),
+            llm_timeout_s=float(os.getenv("LLM_TIMEOUT", "30")),
+            llm_max_retries=int(os.getenv("LLM_MAX_RETRIES", "2")),
+            llm_max_output_tokens=int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "0")) or None,
+            llm_prewarm=os.getenv("LLM_PREWARM", "false").lower() in {"1", "true"},
+            llm_deadline_s=float(os.getenv("LLM_DEADLINE", "60")),
         )
 
 
-@lru_cache(maxsize=1)
+SETTINGS: Settings = Settings.from_env()
+
+
 def get_settings() -> Settings:
     """전역적으로 재사용 가능한 Settings 인스턴스를 반환한다.
 
     Returns:
-        Settings: 캐싱된 설정 인스턴스.
+        Settings: 모듈 로드 시 한 번 생성된 설정 인스턴스.
     """
 
-    return Settings.from_env()
+    return SETTINGS
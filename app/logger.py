@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 
 LEVEL_EMOJI: dict[int, str] = {
     logging.DEBUG: "🛠️",
@@ -11,6 +12,7 @@ LEVEL_EMOJI: dict[int, str] = {
     logging.ERROR: "❌",
     logging.CRITICAL: "💥",
 }
+_WS_RE = re.compile(r"\s+")
 
 
 class EmojiFormatter(logging.Formatter):
@@ -37,3 +39,14 @@ def get_logger(name: str) -> logging.Logger:
         logger.addHandler(handler)
         logger.propagate = False
     return logger
+
+
+def preview(text: str, limit: int = 80) -> str:
+    """긴 문자열을 로그에 표시하기 위한 요약 버전으로 변환한다.
+
+    입력 길이와 무관하게 앞부분(`limit * 4`자)만 공백 정규화한다.
+    """
+
+    head = text[: limit * 4]
+    compact = _WS_RE.sub(" ", head).strip()
+    return compact[:limit] + ("…" if len(compact) > limit or len(text) > len(head) else "")
@@ -2,11 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import router as api_router
 from .config import Settings, get_settings
+from .services.langgraph import prewarm_llms, setup_checkpointer, warm_up
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """서버 시작 시 체크포인터를 준비하고 백그라운드 스레드에서 워크플로우와 LLM 클라이언트를 예열한다.
+
+    `LLM_PREWARM`이 켜져 있으면 클라이언트 생성이 끝난 뒤 공급자별 연결 예열도 이벤트 루프에서 수행한다.
+    """
+
+    await setup_checkpointer()
+    warmup = threading.Thread(target=warm_up, name="langgraph-warmup", daemon=True)
+    warmup.start()
+
+    async def prewarm() -> None:
+        await asyncio.to_thread(warmup.join)
+        await prewarm_llms()
+
+    prewarm_task = asyncio.create_task(prewarm()) if get_settings().llm_prewarm else None
+    yield
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await prewarm_task
 
 
 def create_app(settings: Settings | None = None) -> FastAPI:
@@ -20,7 +50,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     """
 
     settings = settings or get_settings()
-    app = FastAPI(title="API LangGraph Test", version="0.1.0")
+    app = FastAPI(title="API LangGraph Test", version="0.1.0", lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -0,0 +1,118 @@
+"""LLM 응답 캐시 백엔드와 키 생성 유틸리티."""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Protocol
+
+import orjson
+
+from app.config import get_settings
+from app.logger import get_logger
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover
+    redis_asyncio = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+
+class LLMCache(Protocol):
+    """LLM 응답 캐시가 구현해야 하는 비동기 인터페이스."""
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """키에 해당하는 캐시 값을 반환한다. 없거나 만료되었으면 `None`."""
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> None:
+        """값을 저장한다. `ttl`을 생략하면 백엔드 기본 TTL을 사용한다."""
+
+
+class MemoryLLMCache:
+    """프로세스 메모리에 TTL/LRU 정책으로 응답을 보관하는 캐시."""
+
+    def __init__(self, maxsize: int = 1024, ttl: int = 3600) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> None:
+        self._entries[key] = (time.monotonic() + (ttl or self._ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class RedisLLMCache:
+    """Redis에 응답을 저장해 여러 워커/프로세스가 캐시를 공유하도록 한다.
+
+    Redis 장애는 캐시 미스로 취급해 LLM 호출 경로를 막지 않는다.
+    """
+
+    def __init__(self, url: str, ttl: int = 3600, prefix: str = "llm-cache:") -> None:
+        if redis_asyncio is None:
+            raise RuntimeError("redis 패키지가 설치되어 있지 않습니다.")
+        self._client = redis_asyncio.Redis.from_url(url)
+        self._ttl = ttl
+        self._prefix = prefix
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            raw = await self._client.get(self._prefix + key)
+        except Exception as exc:
+            logger.warning("Redis 캐시 조회 실패: %s", exc)
+            return None
+        return orjson.loads(raw) if raw else None
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int | None = None) -> None:
+        try:
+            await self._client.set(self._prefix + key, orjson.dumps(value), ex=ttl or self._ttl)
+        except Exception as exc:
+            logger.warning("Redis 캐시 저장 실패: %s", exc)
+
+
+def make_cache_key(model: str, prompt: str) -> str:
+    """모델명과 프롬프트로 캐시 키(sha256 hex)를 생성한다.
+
+    Args:
+        model: 공급자/모델 식별자.
+        prompt: 모델에 전달한 전체 프롬프트.
+
+    Returns:
+        str: 정렬된 JSON을 해시한 64자리 16진수 문자열.
+    """
+    payload = orjson.dumps({"model": model, "q": prompt.strip()}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMCache | None:
+    """설정에 맞는 캐시 백엔드를 반환한다.
+
+    Returns:
+        LLMCache | None: `LLM_CACHE_TTL`이 0이면 `None`(캐시 비활성화),
+            `REDIS_URL`이 있으면 Redis, 그 외에는 메모리 캐시.
+    """
+    settings = get_settings()
+    if settings.llm_cache_ttl_s <= 0:
+        return None
+    if settings.redis_url:
+        try:
+            return RedisLLMCache(settings.redis_url, ttl=settings.llm_cache_ttl_s)
+        except RuntimeError as exc:
+            logger.warning("Redis 캐시 사용 불가, 메모리 캐시로 대체합니다: %s", exc)
+    return MemoryLLMCache(maxsize=settings.llm_cache_maxsize, ttl=settings.llm_cache_ttl_s)
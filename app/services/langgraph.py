@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
-from typing import Annotated, Any, AsyncIterator, TypedDict, cast
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, TypedDict, cast
 
-from dotenv import load_dotenv
+import httpx
 from langchain_anthropic import ChatAnthropic
 from langchain_core.runnables import RunnableConfig
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -28,11 +31,18 @@ try:
     from langchain_cohere import ChatCohere
 except ImportError:  # pragma: no cover
     ChatCohere = None  # type: ignore[assignment]
+try:
+    from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+except ImportError:  # pragma: no cover
+    AsyncRedisSaver = None  # type: ignore[assignment]
+from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.types import Send
 
-from app.logger import get_logger
+from app.config import Settings, get_settings, load_env
+from app.logger import get_logger, preview
+from app.services.cache import get_llm_cache, make_cache_key
 
 # LangSmith UUID v7 지원
 try:
@@ -41,23 +51,21 @@ except ImportError:
     from uuid import uuid4 as create_uuid
 
 # 환경변수 로드
-load_dotenv()
+load_env()
 
-# LangSmith 추적 설정 (노트북 파일 기준)
-logging.langsmith("API-LangGraph-Test")
+# LangSmith 추적 설정 (노트북 파일 기준). 노드마다 입출력 직렬화 비용이 들므로 명시적으로 켠 경우에만 활성화한다.
+if get_settings().langsmith_tracing:
+    logging.langsmith(get_settings().langsmith_project)
 
 logger = get_logger(__name__)
 DEFAULT_MAX_TURNS = 3
+HISTORY_SUMMARY_MODEL = "gpt-5-nano"
+# openai SDK 기본값(1000/100)보다 낮지만, 동시 호출 수가 LLM_MAX_CONCURRENCY(기본 32)로 제한되므로 충분하다.
+LLM_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+AsyncInvoke = Callable[[str], Awaitable[Any]]
 
 
-def _preview(text: str, limit: int = 80) -> str:
-    """긴 문자열을 로그에 표시하기 위한 요약 버전으로 변환한다."""
-
-    compact = " ".join(text.split())
-    return compact[:limit] + ("…" if len(compact) > limit else "")
-
-
-async def _summarize_content(llm: Any, content: str, label: str) -> str:
+async def _summarize_content(ainvoke: AsyncInvoke, content: str, label: str) -> str:
     """모델 응답을 짧게 요약한다."""
 
     summary_prompt = (
@@ -65,7 +73,7 @@ async def _summarize_content(llm: Any, content: str, label: str) -> str:
         f"답변:\n{content}\n"
     )
     try:
-        response = await _ainvoke(llm, summary_prompt)
+        response = await ainvoke(summary_prompt)
         text = response.content if hasattr(response, "content") else str(response)
         return str(text)
     except Exception as exc:
@@ -81,6 +89,108 @@ def merge_dicts(existing: dict | None, new: dict | None) -> dict:
     return merged
 
 
+@lru_cache(maxsize=1)
+def _http_async_client() -> httpx.AsyncClient:
+    """OpenAI 호환 클라이언트와 Groq 클라이언트가 공유하는 keep-alive 커넥션 풀을 반환한다."""
+
+    return httpx.AsyncClient(limits=LLM_HTTP_LIMITS)
+
+
+def _client_limits(*, timeout_key: str = "timeout", max_tokens_key: str = "max_tokens") -> dict[str, Any]:
+    """모든 LLM 클라이언트에 공통으로 적용할 타임아웃/재시도/출력 토큰 상한 인자를 만든다.
+
+    한 공급자가 응답하지 않아도 fan-out 전체가 UI 타임아웃까지 묶이지 않도록 한다.
+    SDK마다 인자 이름이 다르므로 필요한 경우 키 이름을 바꿔 전달한다.
+
+    Args:
+        timeout_key: 요청 타임아웃(초)을 받는 생성자 인자 이름.
+        max_tokens_key: 최대 출력 토큰 수를 받는 생성자 인자 이름.
+
+    Returns:
+        dict[str, Any]: 클라이언트 생성자에 그대로 펼쳐 넘길 키워드 인자.
+    """
+    settings = get_settings()
+    limits: dict[str, Any] = {timeout_key: settings.llm_timeout_s, "max_retries": settings.llm_max_retries}
+    if settings.llm_max_output_tokens:
+        limits[max_tokens_key] = settings.llm_max_output_tokens
+    return limits
+
+
+@lru_cache(maxsize=None)
+def _openai_llm(model: str) -> ChatOpenAI:
+    """OpenAI 클라이언트를 모델별로 한 번만 생성해 HTTP 커넥션 풀을 재사용한다."""
+
+    return ChatOpenAI(model=model, http_async_client=_http_async_client(), **_client_limits())
+
+
+@lru_cache(maxsize=None)
+def _gemini_llm(model: str) -> ChatGoogleGenerativeAI:
+    """Gemini 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatGoogleGenerativeAI(
+        model=model, temperature=0, **_client_limits(max_tokens_key="max_output_tokens")
+    )
+
+
+@lru_cache(maxsize=None)
+def _anthropic_llm(model: str) -> ChatAnthropic:
+    """Anthropic 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatAnthropic(model=model, temperature=0, **_client_limits())
+
+
+@lru_cache(maxsize=None)
+def _upstage_llm(model: str) -> ChatUpstage:
+    """Upstage 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatUpstage(model=model, http_async_client=_http_async_client(), **_client_limits())
+
+
+@lru_cache(maxsize=None)
+def _perplexity_llm(model: str) -> ChatPerplexity:
+    """Perplexity 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatPerplexity(
+        model=model,
+        temperature=0.2,
+        top_p=0.9,
+        search_domain_filter=["perplexity.ai"],
+        return_images=False,
+        return_related_questions=True,
+        top_k=0,
+        stream=False,
+        **_client_limits(timeout_key="request_timeout"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _mistral_llm(model: str) -> Any:
+    """Mistral 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatMistralAI(model=model, temperature=0, **_client_limits())
+
+
+@lru_cache(maxsize=None)
+def _groq_llm(model: str) -> Any:
+    """Groq 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatGroq(model=model, temperature=0, http_async_client=_http_async_client(), **_client_limits())
+
+
+@lru_cache(maxsize=None)
+def _cohere_llm(model: str) -> Any:
+    """Cohere 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatCohere(model=model, temperature=0, **_client_limits(timeout_key="timeout_seconds"))
+
+
+@lru_cache(maxsize=None)
+def _history_summary_llm(model: str) -> ChatOpenAI:
+    """대화 이력 요약에 사용하는 OpenAI 클라이언트를 모델별로 한 번만 생성한다."""
+
+    return ChatOpenAI(model=model, temperature=0, http_async_client=_http_async_client(), **_client_limits())
+
+
 class GraphState(TypedDict, total=False):
     """LangGraph 실행 시 공유되는 상태 정의."""
 
@@ -91,6 +201,7 @@ class GraphState(TypedDict, total=False):
     turn: Annotated[int | None, "현재 턴 인덱스"]
     current_inputs: Annotated[dict[str, str] | None, merge_dicts]
     active_models: Annotated[list[str] | None, "활성화된 모델 목록"]
+    first_only: Annotated[bool | None, "첫 답변 후 종료한 실행(재개 불가)"]
 
     openai_answer: Annotated[str | None, "OpenAI 응답"]
     gemini_answer: Annotated[str | None, "Google Gemini 응답"]
@@ -131,7 +242,7 @@ def _default_active_models() -> list[str]:
 
 def _model_label(node_name: str) -> str:
     meta = NODE_CONFIG.get(node_name)
-    return meta["label"] if meta else node_name
+    return meta.label if meta else node_name
 
 
 def build_status_from_response(
@@ -147,7 +258,9 @@ def build_status_from_response(
     Returns:
         dict[str, Any]: `status`, `detail` 키를 포함한 상태 정보.
     """
-    metadata = getattr(response, "response_metadata", None) or {}
+    metadata = getattr(response, "response_metadata", None)
+    if not metadata:
+        return {"status": default_status, "detail": detail}
     status = metadata.get("status_code") or metadata.get("status") or metadata.get("http_status")
     detail_text = metadata.get("finish_reason") or metadata.get("reason") or detail
     return {"status": status or default_status, "detail": detail_text}
@@ -160,8 +273,11 @@ def build_status_from_error(error: Exception) -> dict[str, Any]:
         error: 발생한 예외 인스턴스.
 
     Returns:
-        dict[str, Any]: 실패 상태와 메시지를 담은 상태 정보.
+        dict[str, Any]: 실패 상태와 메시지를 담은 상태 정보. 타임아웃은 응답 지연과 오류를 구분할 수 있도록
+            `status="timeout"`으로 표시한다.
     """
+    if isinstance(error, (TimeoutError, httpx.TimeoutException)) or "Timeout" in type(error).__name__:
+        return {"status": "timeout", "detail": str(error) or type(error).__name__}
     status = cast(int | None, getattr(error, "status_code", None))
     if status is None:
         response = getattr(error, "response", None)
@@ -170,17 +286,19 @@ def build_status_from_error(error: Exception) -> dict[str, Any]:
     return {"status": status or "error", "detail": str(error)}
 
 
-def format_response_message(label: str, payload: Any) -> tuple[str, str]:
-    """메시지 로그에 저장할 간단한 (role, content) 튜플을 생성한다.
+def format_response_message(label: str, payload: Any) -> dict[str, str]:
+    """메시지 로그에 저장할 간단한 메시지 딕셔너리를 생성한다.
+
+    생성 시점에 고유 `id`를 부여해, 스트림 소비 측이 긴 본문을 해시하지 않고 `id`만으로 중복을 거를 수 있다.
 
     Args:
         label: 메시지 헤더(모델명 또는 오류 등).
         payload: 원본 응답 또는 예외 객체.
 
     Returns:
-        tuple[str, str]: `("assistant", "[라벨] 내용")` 형태의 메시지.
+        dict[str, str]: `{"role": "assistant", "content": "[라벨] 내용", "id": ...}` 형태의 메시지.
     """
-    return ("assistant", f"[{label}] {payload}")
+    return {"role": "assistant", "content": f"[{label}] {payload}", "id": create_uuid().hex}
 
 
 def init_question(state: GraphState) -> GraphState:
@@ -193,355 +311,377 @@ def init_question(state: GraphState) -> GraphState:
     max_turns = state.get("max_turns") or DEFAULT_MAX_TURNS
     active_models = state.get("active_models") or list(NODE_CONFIG.keys())
     current_inputs = state.get("current_inputs") or {
-        NODE_CONFIG[node]["label"]: question for node in active_models
+        NODE_CONFIG[node].label: question for node in active_models
     }
     history = state.get("conversation_history")
     if not history:
         history = [{"role": "user", "content": question}]
     turn_value = state.get("turn") or 1
 
-    logger.debug("질문 초기화: %s", _preview(question))
-    return GraphState(
-        question=question,
-        max_turns=max_turns,
-        turn=turn_value,
-        conversation_history=history,
-        history_summary=state.get("history_summary"),
-        current_inputs=current_inputs,
-        active_models=active_models,
-        raw_responses=state.get("raw_responses") or {},
-        self_summaries=state.get("self_summaries") or {},
-        messages=state.get("messages") or [("user", question)],
-    )
-
-
-async def _ainvoke(llm: Any, question: str) -> Any:
-    """주어진 LLM에서 비동기 호출을 수행한다."""
+    logger.debug("질문 초기화: %s", preview(question))
+    return {
+        "question": question,
+        "max_turns": max_turns,
+        "turn": turn_value,
+        "conversation_history": history,
+        "history_summary": state.get("history_summary"),
+        "current_inputs": current_inputs,
+        "active_models": active_models,
+        "raw_responses": state.get("raw_responses") or {},
+        "self_summaries": state.get("self_summaries") or {},
+        "messages": state.get("messages") or [("user", question)],
+    }
 
-    if hasattr(llm, "ainvoke"):
-        return await llm.ainvoke(question)
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, llm.invoke, question)
 
+@lru_cache(maxsize=None)
+def _get_ainvoke(llm_factory: Callable[[str], Any], model: str) -> AsyncInvoke:
+    """클라이언트 팩토리/모델별 비동기 호출 함수를 한 번만 결정해 캐싱한다.
 
-async def call_openai(state: GraphState) -> GraphState:
-    """OpenAI 모델을 호출하고 응답/상태를 반환한다.
+    `ainvoke`를 제공하지 않는 모델만 스레드 풀에서 `invoke`를 실행하는 래퍼로 감싼다.
 
     Args:
-        state: 질문을 포함한 그래프 상태.
+        llm_factory: 모델명을 받아 캐싱된 LLM 클라이언트를 반환하는 팩토리.
+        model: 사용할 모델명.
 
     Returns:
-        GraphState: OpenAI 응답/상태/메시지를 담은 상태 델타.
+        AsyncInvoke: 프롬프트를 받아 응답을 반환하는 코루틴 함수.
     """
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("OpenAI") or question
-    llm = ChatOpenAI(model="gpt-5-nano")
-    logger.debug("OpenAI 호출 시작")
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "OpenAI")
-        logger.info("OpenAI 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            openai_answer=content,
-            openai_status=status,
-            openai_summary=summary,
-            raw_responses={"OpenAI": content},
-            self_summaries={"OpenAI": summary},
-            messages=[format_response_message("OpenAI", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("OpenAI 호출 실패: %s", exc)
-        return GraphState(
-            openai_status=status,
-            messages=[format_response_message("OpenAI 오류", exc)],
-        )
+    llm = llm_factory(model)
+    if hasattr(llm, "ainvoke"):
+        return llm.ainvoke
 
+    async def ainvoke(prompt: str) -> Any:
+        return await asyncio.to_thread(llm.invoke, prompt)
 
-async def call_gemini(state: GraphState) -> GraphState:
-    """Google Gemini 모델을 호출한다.
+    return ainvoke
 
-    Args:
-        state: 질문을 포함한 그래프 상태.
 
-    Returns:
-        GraphState: Gemini 응답/상태/메시지를 담은 상태 델타.
+def _chunk_text(chunk: Any) -> str:
+    """LLM 응답(또는 스트림 청크)에서 텍스트만 추출한다.
+
+    Anthropic처럼 content가 블록 리스트로 오는 경우 `text` 필드만 이어 붙인다.
     """
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Gemini") or question
-    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash-lite", temperature=0)
-    logger.debug("Gemini 호출 시작")
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Gemini")
-        logger.info("Gemini 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            gemini_answer=content,
-            gemini_status=status,
-            gemini_summary=summary,
-            raw_responses={"Gemini": content},
-            self_summaries={"Gemini": summary},
-            messages=[format_response_message("Gemini", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Gemini 호출 실패: %s", exc)
-        return GraphState(
-            gemini_status=status,
-            messages=[format_response_message("Gemini 오류", exc)],
-        )
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+    return str(content)
 
 
-async def call_anthropic(state: GraphState) -> GraphState:
-    """Anthropic Claude 모델을 호출한다.
+async def _astream_response(llm: Any, prompt: str, on_token: Callable[[str], None]) -> Any:
+    """LLM 응답을 토큰 단위로 스트리밍하면서 최종 응답 청크를 누적한다.
 
     Args:
-        state: 질문을 포함한 그래프 상태.
+        llm: `astream`을 제공하는 LangChain 채팅 모델.
+        prompt: 모델 입력 프롬프트.
+        on_token: 새 텍스트 조각이 도착할 때마다 호출되는 콜백.
 
     Returns:
-        GraphState: Claude 응답/상태/메시지를 담은 상태 델타.
+        Any: 모든 청크를 합친 응답 객체(`AIMessageChunk`).
+
+    Raises:
+        RuntimeError: 모델이 아무 청크도 반환하지 않은 경우.
     """
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Anthropic") or question
-    llm = ChatAnthropic(model="claude-haiku-4-5-20251001", temperature=0)
-    logger.debug("Anthropic 호출 시작")
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Anthropic")
-        logger.info("Anthropic 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            anthropic_answer=content,
-            anthropic_status=status,
-            anthropic_summary=summary,
-            raw_responses={"Anthropic": content},
-            self_summaries={"Anthropic": summary},
-            messages=[format_response_message("Anthropic", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Anthropic 호출 실패: %s", exc)
-        return GraphState(
-            anthropic_status=status,
-            messages=[format_response_message("Anthropic 오류", exc)],
-        )
+    response = None
+    async for chunk in llm.astream(prompt):
+        response = chunk if response is None else response + chunk
+        delta = _chunk_text(chunk)
+        if delta:
+            on_token(delta)
+    if response is None:
+        raise RuntimeError("모델이 빈 응답을 반환했습니다.")
+    return response
+
+
+@dataclass(frozen=True, slots=True)
+class NodeMeta:
+    """LLM 노드별 표시 라벨, 상태 키, 모델/클라이언트 팩토리 정보.
+
+    `cacheable`은 결정적(temperature=0) 설정으로 호출되는 모델에만 켜서 응답 캐시를 허용한다.
+    `weight`는 공급자별 기본 동시 호출 상한(`LLM_PROVIDER_MAX_CONCURRENCY`)에 곱하는 배율이다.
+    """
+
+    name: str
+    label: str
+    answer_key: str
+    status_key: str
+    summary_key: str
+    model: str
+    llm_factory: Callable[[str], Any] | None
+    cacheable: bool = False
+    package: str = ""
+    weight: float = 1.0
+
+
+NODE_METAS: tuple[NodeMeta, ...] = (
+    NodeMeta(
+        "call_openai", "OpenAI", "openai_answer", "openai_status", "openai_summary", "gpt-5-nano", _openai_llm
+    ),
+    NodeMeta(
+        "call_gemini",
+        "Gemini",
+        "gemini_answer",
+        "gemini_status",
+        "gemini_summary",
+        "gemini-2.5-flash-lite",
+        _gemini_llm,
+        cacheable=True,
+    ),
+    NodeMeta(
+        "call_anthropic",
+        "Anthropic",
+        "anthropic_answer",
+        "anthropic_status",
+        "anthropic_summary",
+        "claude-haiku-4-5-20251001",
+        _anthropic_llm,
+        cacheable=True,
+    ),
+    NodeMeta(
+        "call_perplexity",
+        "Perplexity",
+        "perplexity_answer",
+        "perplexity_status",
+        "perplexity_summary",
+        "sonar",
+        _perplexity_llm,
+        weight=0.5,
+    ),
+    NodeMeta(
+        "call_upstage", "Upstage", "upstage_answer", "upstage_status", "upstage_summary", "solar-mini", _upstage_llm
+    ),
+    NodeMeta(
+        "call_mistral",
+        "Mistral",
+        "mistral_answer",
+        "mistral_status",
+        "mistral_summary",
+        "mistral-large-latest",
+        _mistral_llm if ChatMistralAI is not None else None,
+        cacheable=True,
+        package="langchain-mistralai",
+    ),
+    NodeMeta(
+        "call_groq",
+        "Groq",
+        "groq_answer",
+        "groq_status",
+        "groq_summary",
+        "llama3-70b-8192",
+        _groq_llm if ChatGroq is not None else None,
+        cacheable=True,
+        package="langchain-groq",
+    ),
+    NodeMeta(
+        "call_cohere",
+        "Cohere",
+        "cohere_answer",
+        "cohere_status",
+        "cohere_summary",
+        "command-r-plus",
+        _cohere_llm if ChatCohere is not None else None,
+        cacheable=True,
+        package="langchain-cohere",
+    ),
+)
+# 스트림 루프/노드 조회용 이름 → 메타데이터 인덱스. 순회가 필요하면 NODE_METAS를 사용한다.
+NODE_CONFIG: dict[str, NodeMeta] = {meta.name: meta for meta in NODE_METAS}
+
+
+def _provider_limit(meta: NodeMeta, settings: Settings) -> int:
+    """공급자별 동시 호출 상한을 계산한다.
+
+    `<LABEL>_MAX_CONCURRENCY`로 지정한 값(`Settings.from_env`에서 1 이상으로 검증)이 있으면 그 값을,
+    없으면 공급자별 기본 상한에 `weight`를 곱한 값(최소 1)을 사용하며 어느 경우든 전체 상한을 넘지 않는다.
+    공급자별 상한의 합은 전체 상한보다 클 수 있으며, 프로세스 전체 동시 호출 수는 전체 세마포어가 제한한다.
+    """
+
+    limit = dict(settings.llm_provider_concurrency).get(meta.label.lower())
+    if limit is None:
+        limit = max(1, round(settings.llm_provider_max_concurrency * meta.weight))
+    return min(limit, settings.llm_max_concurrency)
 
 
-async def call_upstage(state: GraphState) -> GraphState:
-    """Upstage Solar 모델을 호출한다.
+@lru_cache(maxsize=1)
+def _concurrency_semaphores(
+    loop: asyncio.AbstractEventLoop, settings: Settings
+) -> tuple[dict[str, asyncio.Semaphore], asyncio.Semaphore]:
+    """실행 중인 이벤트 루프와 설정에 맞춘 공급자별/전체 세마포어를 반환한다.
+
+    임포트 시점이 아니라 첫 호출 시 만들고, 루프나 `Settings`가 바뀌면 새로 만든다.
+    공급자별 세마포어는 공급자 RPM/TPM 한도와 느린 공급자의 점유를, 전체 세마포어는 프로세스 전체 동시 호출 수를 제한한다.
+    asyncio.Semaphore는 대기자를 FIFO로 깨우므로 오래 기다린 요청이 뒤로 밀리지 않는다.
 
     Args:
-        state: 질문을 포함한 그래프 상태.
+        loop: 세마포어를 사용할 이벤트 루프(캐시 키로만 사용).
+        settings: 동시 호출 상한을 담은 설정.
 
     Returns:
-        GraphState: Upstage 응답/상태/메시지를 담은 상태 델타.
+        tuple[dict[str, asyncio.Semaphore], asyncio.Semaphore]: 노드 이름별 세마포어와 전체 세마포어.
     """
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Upstage") or question
-    llm = ChatUpstage(model="solar-mini")
-    logger.debug("Upstage 호출 시작")
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Upstage")
-        logger.info("Upstage 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            upstage_answer=content,
-            upstage_status=status,
-            upstage_summary=summary,
-            raw_responses={"Upstage": content},
-            self_summaries={"Upstage": summary},
-            messages=[format_response_message("Upstage", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Upstage 호출 실패: %s", exc)
-        return GraphState(
-            upstage_status=status,
-            messages=[format_response_message("Upstage 오류", exc)],
-        )
+    provider = {meta.name: asyncio.Semaphore(_provider_limit(meta, settings)) for meta in NODE_METAS}
+    return provider, asyncio.Semaphore(settings.llm_max_concurrency)
 
 
-async def call_perplexity(state: GraphState) -> GraphState:
-    """Perplexity Sonar 모델을 호출한다.
+TokenCallback = Callable[[str], None]
 
-    Args:
-        state: 질문을 포함한 그래프 상태.
 
-    Returns:
-        GraphState: Perplexity 응답/상태/메시지를 담은 상태 델타.
-    """
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Perplexity") or question
-    llm = ChatPerplexity(
-        model="sonar",
-        temperature=0.2,
-        top_p=0.9,
-        search_domain_filter=["perplexity.ai"],
-        return_images=False,
-        return_related_questions=True,
-        top_k=0,
-        stream=False,
-    )
-    logger.debug("Perplexity 호출 시작")
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Perplexity")
-        logger.info("Perplexity 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            perplexity_answer=content,
-            perplexity_status=status,
-            perplexity_summary=summary,
-            raw_responses={"Perplexity": content},
-            self_summaries={"Perplexity": summary},
-            messages=[format_response_message("Perplexity", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Perplexity 호출 실패: %s", exc)
-        return GraphState(
-            perplexity_status=status,
-            messages=[format_response_message("Perplexity 오류", exc)],
-        )
+@dataclass(slots=True)
+class _Flight:
+    """진행 중인 공유 LLM 호출과 그 호출을 기다리는 요청들의 토큰 콜백."""
 
+    task: asyncio.Task[dict[str, Any]] | None = None
+    waiters: int = 0
+    deltas: list[str] = field(default_factory=list)
+    listeners: list[TokenCallback] = field(default_factory=list)
 
-async def call_mistral(state: GraphState) -> GraphState:
-    """Mistral AI 모델을 호출한다."""
+    def emit(self, delta: str) -> None:
+        """토큰 조각을 기록하고 현재 기다리는 모든 요청에 전달한다."""
 
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Mistral") or question
-    if ChatMistralAI is None:
-        error = RuntimeError("langchain-mistralai 패키지가 설치되어 있지 않습니다.")
-        logger.warning("Mistral AI 사용 불가: %s", error)
-        status = build_status_from_error(error)
-        return GraphState(
-            mistral_status=status,
-            messages=[format_response_message("Mistral 오류", error)],
-        )
-    llm = ChatMistralAI(model="mistral-large-latest", temperature=0)
-    try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Mistral")
-        logger.info("Mistral 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            mistral_answer=content,
-            mistral_status=status,
-            mistral_summary=summary,
-            raw_responses={"Mistral": content},
-            self_summaries={"Mistral": summary},
-            messages=[format_response_message("Mistral", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Mistral 호출 실패: %s", exc)
-        return GraphState(
-            mistral_status=status,
-            messages=[format_response_message("Mistral 오류", exc)],
-        )
+        self.deltas.append(delta)
+        for listener in tuple(self.listeners):
+            listener(delta)
 
 
-async def call_groq(state: GraphState) -> GraphState:
-    """Groq 기반 모델을 호출한다."""
+_inflight: dict[str, _Flight] = {}
 
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Groq") or question
-    if ChatGroq is None:
-        error = RuntimeError("langchain-groq 패키지가 설치되어 있지 않습니다.")
-        logger.warning("Groq 사용 불가: %s", error)
-        status = build_status_from_error(error)
-        return GraphState(
-            groq_status=status,
-            messages=[format_response_message("Groq 오류", error)],
-        )
-    try:
-        llm = ChatGroq(model="llama3-70b-8192", temperature=0)
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Groq")
-        logger.info("Groq 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            groq_answer=content,
-            groq_status=status,
-            groq_summary=summary,
-            raw_responses={"Groq": content},
-            self_summaries={"Groq": summary},
-            messages=[format_response_message("Groq", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Groq 호출 실패: %s", exc)
-        return GraphState(
-            groq_status=status,
-            messages=[format_response_message("Groq 오류", exc)],
-        )
 
+async def _single_flight(
+    key: str,
+    work: Callable[[TokenCallback], Awaitable[dict[str, Any]]],
+    on_token: TokenCallback,
+) -> dict[str, Any]:
+    """같은 키로 동시에 들어온 호출이 하나의 실행 결과와 토큰 스트림을 공유하도록 한다.
 
-async def call_cohere(state: GraphState) -> GraphState:
-    """Cohere Command 모델을 호출한다."""
+    첫 호출자만 `work()`를 태스크로 실행하고, 완료 전까지 같은 키로 들어온 호출자는
+    그 태스크를 함께 기다린다. 토큰 조각은 기다리는 모든 호출자의 `on_token`으로 전달되며,
+    나중에 합류한 호출자에게는 그때까지 생성된 조각을 먼저 재전송한다. 취소된 호출자의 콜백은
+    즉시 제거되므로 읽는 쪽이 없는 그래프 실행으로 토큰을 보내지 않는다.
+    한 호출자가 취소되어도 `asyncio.shield`로 공유 태스크는 유지되며,
+    기다리는 호출자가 모두 취소되면 공유 태스크도 취소해 더 이상 토큰을 소비하지 않게 한다.
 
-    inputs = state.get("current_inputs") or {}
-    question = state["question"]
-    prompt = inputs.get("Cohere") or question
-    if ChatCohere is None:
-        error = RuntimeError("langchain-cohere 패키지가 설치되어 있지 않습니다.")
-        logger.warning("Cohere 사용 불가: %s", error)
-        status = build_status_from_error(error)
-        return GraphState(
-            cohere_status=status,
-            messages=[format_response_message("Cohere 오류", error)],
-        )
-    llm = ChatCohere(model="command-r-plus", temperature=0)
+    Args:
+        key: 모델명과 프롬프트로 만든 요청 식별 키.
+        work: 토큰 콜백을 받아 실제 LLM 호출을 수행하는 코루틴 팩토리.
+        on_token: 이 호출자에게 토큰 조각을 전달하는 콜백.
+
+    Returns:
+        dict[str, Any]: `work()`가 반환한 결과.
+    """
+    flight = _inflight.get(key)
+    if flight is None or flight.task.cancelling():
+        # 취소 중인 태스크에 합류하면 CancelledError를 받으므로 새로 실행한다.
+        flight = _Flight()
+        flight.task = asyncio.create_task(work(flight.emit))
+        _inflight[key] = flight
+
+        def _release(done: asyncio.Task[dict[str, Any]]) -> None:
+            current = _inflight.get(key)
+            if current is not None and current.task is done:
+                del _inflight[key]
+
+        flight.task.add_done_callback(_release)
+    else:
+        logger.debug("진행 중인 동일 요청에 합류: %s", key[:12])
+        for delta in flight.deltas:
+            on_token(delta)
+    flight.listeners.append(on_token)
+    flight.waiters += 1
     try:
-        response = await _ainvoke(llm, prompt)
-        content = response.content if hasattr(response, "content") else str(response)
-        status = build_status_from_response(response)
-        summary = await _summarize_content(llm, content, "Cohere")
-        logger.info("Cohere 응답 완료: %s", status.get("detail"))
-        return GraphState(
-            cohere_answer=content,
-            cohere_status=status,
-            cohere_summary=summary,
-            raw_responses={"Cohere": content},
-            self_summaries={"Cohere": summary},
-            messages=[format_response_message("Cohere", response)],
-        )
-    except Exception as exc:
-        status = build_status_from_error(exc)
-        logger.warning("Cohere 호출 실패: %s", exc)
-        return GraphState(
-            cohere_status=status,
-            messages=[format_response_message("Cohere 오류", exc)],
-        )
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.listeners.remove(on_token)
+        flight.waiters -= 1
+        if not flight.waiters and not flight.task.done():
+            # done 콜백을 기다리지 않고 바로 제거해 그 사이 들어온 호출자가 취소될 태스크에 합류하지 않게 한다.
+            if _inflight.get(key) is flight:
+                del _inflight[key]
+            flight.task.cancel()
+
+
+def _answer_delta(meta: NodeMeta, content: str, status: dict[str, Any], summary: str) -> GraphState:
+    """성공한 LLM 호출 결과를 그래프 상태 델타로 변환한다.
+
+    캐시 적중 여부와 무관하게 메시지는 응답 텍스트로 만들어 대화 이력의 형태를 일정하게 유지한다.
+    """
 
+    return {
+        meta.answer_key: content,
+        meta.status_key: status,
+        meta.summary_key: summary,
+        "raw_responses": {meta.label: content},
+        "self_summaries": {meta.label: summary},
+        "messages": [format_response_message(meta.label, content)],
+    }
+
+
+def _make_node(meta: NodeMeta) -> Callable[[GraphState], Awaitable[GraphState]]:
+    """`NODE_METAS` 항목으로부터 LLM 호출 노드를 생성한다.
 
-NODE_CONFIG: dict[str, dict[str, str]] = {
-    "call_openai": {"label": "OpenAI", "answer_key": "openai_answer", "status_key": "openai_status"},
-    "call_gemini": {"label": "Gemini", "answer_key": "gemini_answer", "status_key": "gemini_status"},
-    "call_anthropic": {"label": "Anthropic", "answer_key": "anthropic_answer", "status_key": "anthropic_status"},
-    "call_perplexity": {"label": "Perplexity", "answer_key": "perplexity_answer", "status_key": "perplexity_status"},
-    "call_upstage": {"label": "Upstage", "answer_key": "upstage_answer", "status_key": "upstage_status"},
-    "call_mistral": {"label": "Mistral", "answer_key": "mistral_answer", "status_key": "mistral_status"},
-    "call_groq": {"label": "Groq", "answer_key": "groq_answer", "status_key": "groq_status"},
-    "call_cohere": {"label": "Cohere", "answer_key": "cohere_answer", "status_key": "cohere_status"},
-}
+    Args:
+        meta: 노드 이름/라벨/상태 키/클라이언트 팩토리를 담은 노드 메타데이터.
+
+    Returns:
+        Callable[[GraphState], Awaitable[GraphState]]: 응답/상태/메시지를 상태 델타로 반환하는 비동기 노드.
+    """
+    node_name = meta.name
+    label = meta.label
+
+    async def call_llm(state: GraphState) -> GraphState:
+        inputs = state.get("current_inputs") or {}
+        prompt = inputs.get(label) or state["question"]
+        if meta.llm_factory is None:
+            error = RuntimeError(f"{meta.package} 패키지가 설치되어 있지 않습니다.")
+            logger.warning("%s 사용 불가: %s", label, error)
+            return {
+                meta.status_key: build_status_from_error(error),
+                "messages": [format_response_message(f"{label} 오류", error)],
+            }
+        logger.debug("%s 호출 시작", label)
+        writer = get_stream_writer()
+
+        def on_token(delta: str) -> None:
+            writer({"type": "token", "model": label, "node": node_name, "delta": delta})
+
+        cache = get_llm_cache() if meta.cacheable else None
+        cache_key = make_cache_key(meta.model, prompt)
+
+        async def generate(emit: TokenCallback) -> dict[str, Any]:
+            # 공급자별 세마포어를 먼저 잡으므로 한 공급자에 대기가 몰려도 전체 슬롯을 쥔 채 기다리지 않는다.
+            provider_semaphores, global_semaphore = _concurrency_semaphores(asyncio.get_running_loop(), get_settings())
+            async with provider_semaphores[node_name], global_semaphore:
+                response = await _astream_response(meta.llm_factory(meta.model), prompt, emit)
+                content = _chunk_text(response)
+                status = build_status_from_response(response)
+                summary = await _summarize_content(_get_ainvoke(meta.llm_factory, meta.model), content, label)
+            if cache is not None:
+                await cache.set(cache_key, {"content": content, "status": status, "summary": summary})
+            return {"content": content, "status": status, "summary": summary}
+
+        started = time.perf_counter()
+        try:
+            if cache is not None:
+                cached = await cache.get(cache_key)
+                if cached is not None:
+                    logger.info("%s 캐시 적중", label)
+                    status = {**cached["status"], "cached": True}
+                    return _answer_delta(meta, cached["content"], status, cached["summary"])
+            result = await _single_flight(cache_key, generate, on_token)
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            logger.info("%s 응답 완료 (%dms): %s", label, elapsed_ms, result["status"].get("detail"))
+            return _answer_delta(meta, result["content"], result["status"], result["summary"])
+        except Exception as exc:
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            logger.warning("%s 호출 실패 (%dms): %s", label, elapsed_ms, exc)
+            return {
+                meta.status_key: build_status_from_error(exc),
+                "messages": [format_response_message(f"{label} 오류", exc)],
+            }
+
+    call_llm.__name__ = call_llm.__qualname__ = node_name
+    call_llm.__doc__ = f"{label} 모델을 호출하고 응답/상태를 반환한다."
+    return call_llm
 
 
 def dispatch_llm_calls(state: GraphState) -> list[Send]:
@@ -564,49 +704,101 @@ def build_workflow():
     logger.debug("LangGraph 워크플로우 컴파일 시작")
     workflow = StateGraph(GraphState)
     workflow.add_node("init_question", init_question)
-    workflow.add_node("call_openai", call_openai)
-    workflow.add_node("call_gemini", call_gemini)
-    workflow.add_node("call_anthropic", call_anthropic)
-    workflow.add_node("call_upstage", call_upstage)
-    workflow.add_node("call_perplexity", call_perplexity)
-    workflow.add_node("call_mistral", call_mistral)
-    workflow.add_node("call_groq", call_groq)
-    workflow.add_node("call_cohere", call_cohere)
+    for meta in NODE_METAS:
+        workflow.add_node(meta.name, _make_node(meta))
+        workflow.add_edge(meta.name, END)
 
     workflow.add_conditional_edges("init_question", dispatch_llm_calls)
 
-    workflow.add_edge("call_openai", END)
-    workflow.add_edge("call_gemini", END)
-    workflow.add_edge("call_anthropic", END)
-    workflow.add_edge("call_upstage", END)
-    workflow.add_edge("call_perplexity", END)
-    workflow.add_edge("call_mistral", END)
-    workflow.add_edge("call_groq", END)
-    workflow.add_edge("call_cohere", END)
-
     workflow.set_entry_point("init_question")
-    compiled = workflow.compile()
+    compiled = workflow.compile(checkpointer=get_checkpointer())
     logger.info("LangGraph 워크플로우 컴파일 완료")
     return compiled
 
 
-_app = None
+@lru_cache(maxsize=1)
+def get_checkpointer() -> Any | None:
+    """`CHECKPOINT_REDIS_URL`이 설정된 경우 Redis 체크포인터를 반환한다.
+
+    체크포인트를 Redis에 저장하면 연결이 끊긴 실행을 같은 `thread_id`로 이어 받을 수 있고
+    여러 FastAPI 워커가 실행 상태를 공유한다. 질문마다 새 스레드가 생기므로 `CHECKPOINT_TTL_MINUTES`
+    (기본 60분) 후 만료되도록 저장한다.
+
+    Returns:
+        Any | None: `AsyncRedisSaver` 인스턴스. 설정이 없거나 패키지가 없으면 `None`(체크포인트 미사용).
+    """
+    url = get_settings().checkpoint_redis_url
+    if not url:
+        return None
+    if AsyncRedisSaver is None:
+        logger.warning("langgraph-checkpoint-redis 패키지가 없어 체크포인트를 사용하지 않습니다.")
+        return None
+    ttl = {"default_ttl": get_settings().checkpoint_ttl_min, "refresh_on_read": True}
+    return AsyncRedisSaver(redis_url=url, ttl=ttl)
+
+
+async def setup_checkpointer() -> None:
+    """체크포인터가 사용하는 Redis 인덱스를 생성한다. 서버 시작 시 한 번 호출한다."""
+
+    checkpointer = get_checkpointer()
+    if checkpointer is not None:
+        await checkpointer.asetup()
+        logger.info("Redis 체크포인터 초기화 완료")
 
 
+@lru_cache(maxsize=1)
 def get_app():
     """싱글턴 형태로 컴파일된 LangGraph 앱을 반환한다.
 
     Returns:
         Any: 재사용 가능한 LangGraph 애플리케이션 인스턴스.
     """
-    global _app
-    if _app is None:
-        _app = build_workflow()
-    return _app
+    return build_workflow()
+
+
+def warm_up() -> None:
+    """워크플로우 컴파일과 LLM 클라이언트 생성을 미리 수행한다.
+
+    httpx 커넥션 풀, Pydantic 검증기 등 첫 요청에서 생기는 초기화 비용을 서버 시작 시점으로 옮긴다.
+    API 키 누락 등으로 생성에 실패한 클라이언트는 경고만 남기고 실제 호출 시 상태로 보고된다.
+    """
+    get_app()
+    factories = [(_history_summary_llm, HISTORY_SUMMARY_MODEL)]
+    factories.extend((meta.llm_factory, meta.model) for meta in NODE_METAS if meta.llm_factory)
+    for factory, model in factories:
+        try:
+            _get_ainvoke(factory, model)
+        except Exception as exc:
+            logger.warning("%s 클라이언트 예열 실패: %s", model, exc)
+    logger.info("LangGraph/LLM 클라이언트 예열 완료")
+
+
+async def prewarm_llms(timeout: float = 5.0) -> None:
+    """각 공급자에 짧은 요청을 보내 DNS/TLS 연결과 커넥션 풀을 미리 맺어 둔다.
+
+    첫 사용자 요청이 공급자별 콜드 연결 비용을 치르지 않도록 서버 이벤트 루프에서 실행한다.
+    토큰 비용이 발생하므로 `LLM_PREWARM`을 켠 경우에만 호출한다. 실패는 경고만 남긴다.
+
+    Args:
+        timeout: 공급자별 예열 요청 제한 시간(초).
+    """
+    targets = [meta for meta in NODE_METAS if meta.llm_factory]
+
+    async def ping(meta: NodeMeta) -> None:
+        await asyncio.wait_for(_get_ainvoke(meta.llm_factory, meta.model)("ping"), timeout)
+
+    results = await asyncio.gather(*(ping(meta) for meta in targets), return_exceptions=True)
+    for meta, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            logger.warning("%s 연결 예열 실패: %s", meta.label, result)
+    logger.info("LLM 공급자 연결 예열 완료")
 
 
 async def _summarize_history(history: list[dict[str, str]] | None, limit: int = 400) -> str | None:
-    """과거 대화 이력을 2문장 이내로 요약한다."""
+    """과거 대화 이력을 2문장 이내로 요약한다.
+
+    요약 모델은 temperature=0으로 호출하므로 같은 이력의 요약은 응답 캐시에서 재사용한다.
+    """
 
     if not history:
         return None
@@ -617,11 +809,20 @@ async def _summarize_history(history: list[dict[str, str]] | None, limit: int =
         "다음 대화 이력을 2문장 이하, 400자 이내로 요약하세요. 핵심 논점만 남기고 세부사항은 생략합니다.\n\n"
         f"{history_text}"
     )
-    llm = ChatOpenAI(model="gpt-5-nano", temperature=0)
+    cache = get_llm_cache()
+    cache_key = make_cache_key(HISTORY_SUMMARY_MODEL, prompt)
     try:
-        response = await _ainvoke(llm, prompt)
+        if cache is not None:
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                logger.debug("대화 요약 캐시 적중")
+                return str(cached["summary"])[:limit]
+        response = await _get_ainvoke(_history_summary_llm, HISTORY_SUMMARY_MODEL)(prompt)
         content = response.content if hasattr(response, "content") else str(response)
-        return str(content)[:limit]
+        summary = str(content)[:limit]
+        if cache is not None:
+            await cache.set(cache_key, {"summary": summary})
+        return summary
     except Exception as exc:  # pragma: no cover - 요약 실패 시 안전 폴백
         logger.warning("대화 요약 실패, 원본을 절단해 사용합니다: %s", exc)
         compact = " ".join(history_text.split())
@@ -634,7 +835,7 @@ def _build_current_inputs(question: str, history_summary: str | None, active_mod
     prompts: dict[str, str] = {}
     history_block = f"이전 대화 요약: {history_summary}" if history_summary else ""
     for node_name in active_models:
-        label = NODE_CONFIG[node_name]["label"]
+        label = NODE_CONFIG[node_name].label
         sections = [question]
         if history_block:
             sections.append(history_block)
@@ -650,60 +851,148 @@ def _normalize_messages(messages: list | None) -> list[dict[str, str]]:
     """Streamlit 표시를 위해 메시지를 표준화한다.
 
     Args:
-        messages: LangGraph에서 누적된 메시지 리스트.
+        messages: 노드가 이번에 반환한 메시지 델타(누적 상태가 아님).
 
     Returns:
         list[dict[str, str]]: `{"role": ..., "content": ...}` 형태 리스트.
     """
     normalized: list[dict[str, str]] = []
     for message in messages or []:
-        if isinstance(message, (list, tuple)) and len(message) == 2:
+        if isinstance(message, dict):
+            role = message.get("role")
+            content = message.get("content")
+            if isinstance(role, str) and isinstance(content, str):
+                normalized.append(message)
+            else:
+                normalized.append({"role": str(role), "content": str(content)})
+        elif isinstance(message, (list, tuple)) and len(message) == 2:
             role, content = message
-            normalized.append({"role": str(role), "content": str(content)})
+            normalized.append(
+                {
+                    "role": role if isinstance(role, str) else str(role),
+                    "content": content if isinstance(content, str) else str(content),
+                }
+            )
         else:
             normalized.append({"role": "system", "content": str(message)})
     return normalized
 
 
 def _extend_unique_messages(
-    target: list[dict[str, str]], new_messages: list[dict[str, str]] | None, seen: set[tuple[str, str]]
+    target: list[dict[str, str]], new_messages: list[dict[str, str]] | None, seen: set[int | str]
 ) -> None:
     """중복 없이 메시지를 추가한다.
 
     Args:
         target: 메시지를 누적할 리스트.
         new_messages: 새로 추가할 메시지 목록.
-        seen: (role, content) 조합을 저장한 중복 체크 세트.
+        seen: 메시지 `id`(없으면 (role, content) 해시)를 저장한 중복 체크 세트.
     """
     for message in new_messages or []:
-        role = str(message.get("role"))
-        content = str(message.get("content"))
-        key = (role, content)
+        key = message.get("id") or hash((message.get("role"), message.get("content")))
         if key in seen:
             continue
         seen.add(key)
-        target.append({"role": role, "content": content})
+        target.append({"role": str(message.get("role")), "content": str(message.get("content"))})
+
+
+PartialEmitter = Callable[[dict[str, Any], int, int], dict[str, Any]]
+
+
+def _make_emitter(meta: NodeMeta) -> PartialEmitter:
+    """노드 전용 `partial` 이벤트 생성 함수를 만든다.
+
+    라벨과 상태 키를 클로저에 고정해 스트림 루프에서는 상태 조회만 수행한다.
+
+    Args:
+        meta: 노드 메타데이터.
+
+    Returns:
+        PartialEmitter: `(state, turn, elapsed_ms)`를 받아 이벤트 딕셔너리를 반환하는 함수.
+    """
+    node_name = meta.name
+    label = meta.label
+    answer_key = meta.answer_key
+    status_key = meta.status_key
+
+    def emit(state: dict[str, Any], turn: int, elapsed_ms: int) -> dict[str, Any]:
+        return {
+            "model": label,
+            "node": node_name,
+            "answer": state.get(answer_key),
+            "status": state.get(status_key) or {},
+            "messages": _normalize_messages(state.get("messages")),
+            "type": "partial",
+            "turn": turn,
+            "elapsed_ms": elapsed_ms,
+        }
+
+    return emit
+
+
+_EMITTERS: dict[str, PartialEmitter] = {meta.name: _make_emitter(meta) for meta in NODE_METAS}
+
+
+def _completed_node_states(snapshot: Any) -> dict[str, dict[str, Any]]:
+    """체크포인트 스냅샷에서 이미 완료된 LLM 노드의 상태 델타를 노드 이름별로 모은다.
+
+    같은 superstep에서 먼저 끝난 노드의 결과는 `snapshot.tasks`의 `result`(pending write)에,
+    이전 superstep에서 끝난 노드의 결과는 `snapshot.values`에 들어 있다.
+    """
+    completed: dict[str, dict[str, Any]] = {}
+    values = snapshot.values or {}
+    for meta in NODE_METAS:
+        if values.get(meta.status_key) is not None:
+            completed[meta.name] = {meta.answer_key: values.get(meta.answer_key), meta.status_key: values[meta.status_key]}
+    for task in snapshot.tasks:
+        result = getattr(task, "result", None)
+        if task.name in NODE_CONFIG and isinstance(result, dict):
+            completed[task.name] = result
+    return completed
+
+
+def _deadline_partials(finished: set[str], turn: int, elapsed_ms: int, deadline_s: float) -> list[dict[str, Any]]:
+    """마감 시간까지 완료되지 않은 모델마다 `deadline_exceeded` 상태의 partial 이벤트를 만든다."""
+    status = {"status": "deadline_exceeded", "detail": f"전체 마감 시간 {deadline_s:g}초 초과"}
+    return [
+        _EMITTERS[meta.name]({meta.status_key: status}, turn, elapsed_ms)
+        for meta in NODE_METAS
+        if meta.name not in finished
+    ]
 
 
 async def stream_graph(
-    question: str, *, turn: int = 1, max_turns: int | None = None, history: list[dict[str, str]] | None = None
+    question: str,
+    *,
+    turn: int = 1,
+    max_turns: int | None = None,
+    history: list[dict[str, str]] | None = None,
+    first_only: bool = False,
+    thread_id: str | None = None,
 ) -> AsyncIterator[dict[str, Any]]:
     """질문을 받아 LangGraph 워크플로우에서 발생하는 이벤트를 스트리밍한다.
 
     Args:
-        question: 사용자 질문 문자열.
+        question: 사용자 질문 문자열. 호출 측에서 앞뒤 공백을 제거해 전달한다.
         turn: 현재 턴 인덱스(사용자 입력 횟수).
         max_turns: 허용되는 최대 턴 수.
         history: 이전 대화 이력(`role`, `content`).
+        first_only: `True`이면 첫 번째로 답변을 받은 모델의 partial 이벤트 직후 실행을 종료하고
+            아직 응답 중인 나머지 모델 호출을 취소한다.
+        thread_id: 이어 받을 실행의 식별자. 체크포인터가 설정되어 있고 해당 실행이 같은 질문으로
+            끝나지 않은 상태라면 이미 완료된 모델의 partial을 먼저 다시 보낸 뒤 남은 노드만 실행한다.
+            그 외(생략, 완료된 실행, 다른 질문, first_only 실행)에는 새 식별자로 새로 실행한다.
 
     Yields:
-        dict[str, Any]: `type=partial` 이벤트(모델명/응답/상태/메시지).
+        dict[str, Any]: 실행 식별자를 알리는 `type=run` 이벤트, `type=token` 이벤트(모델별 응답 텍스트 조각)와
+            `type=partial` 이벤트(모델명/응답/상태/메시지).
 
     Raises:
         ValueError: 질문이 비어 있는 경우.
     """
-    if not question or not question.strip():
+    if not question:
         raise ValueError("질문을 입력해주세요.")
+    assert question == question.strip(), "question은 strip된 상태로 전달되어야 합니다."
 
     resolved_max_turns = max_turns or DEFAULT_MAX_TURNS
     if turn > resolved_max_turns:
@@ -712,47 +1001,100 @@ async def stream_graph(
         yield {"type": "error", "message": warning, "node": None, "model": None, "turn": turn}
         return
 
-    logger.info("LangGraph 스트림 실행: %s", _preview(question))
-    base_question = question.strip()
+    logger.info("LangGraph 스트림 실행: %s", preview(question))
     app = get_app()
     start_time = time.perf_counter()
-    active_models = list(NODE_CONFIG.keys())
-    history_summary = await _summarize_history(history)
-    current_inputs = _build_current_inputs(base_question, history_summary, active_models)
-    conversation_history = list(history or [])
-    conversation_history.append({"role": "user", "content": base_question})
-    state_inputs: GraphState = {
-        "question": base_question,
-        "max_turns": resolved_max_turns,
-        "turn": turn,
-        "conversation_history": conversation_history,
-        "history_summary": history_summary,
-        "current_inputs": current_inputs,
-        "active_models": active_models,
-    }
+    # 전체 마감 시간은 이력 요약을 포함한 요청 시작 시점부터 계산한다.
+    deadline_s = get_settings().llm_deadline_s
+    deadline_at = asyncio.get_running_loop().time() + deadline_s
+    completed: dict[str, dict[str, Any]] = {}
+    resumed = False
+    if thread_id and get_checkpointer() is not None:
+        snapshot = await app.aget_state(RunnableConfig(configurable={"thread_id": thread_id}))
+        values = snapshot.values or {}
+        # first_only 실행은 의도적으로 남은 노드를 취소했으므로 pending 상태여도 이어 받지 않는다.
+        resumed = bool(snapshot.next) and values.get("question") == question and not values.get("first_only")
+        if resumed:
+            completed = _completed_node_states(snapshot)
+        else:
+            logger.info("이어 받을 수 없는 실행(완료됨/다른 질문/first_only) - 새 스레드로 실행: %s", thread_id)
+    run_thread_id = thread_id if resumed else create_uuid().hex
+    config = RunnableConfig(recursion_limit=20, configurable={"thread_id": run_thread_id})
+    yield {"type": "run", "thread_id": run_thread_id, "resumed": resumed, "turn": turn}
+
+    state_inputs: GraphState | None = None
+    if resumed:
+        # 재연결한 클라이언트가 놓친 완료 결과를 먼저 보내고, 입력 없이 실행해 끝나지 않은 노드만 이어서 실행한다.
+        logger.info("체크포인트에서 실행 재개: %s (완료 %d개)", thread_id, len(completed))
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        for node_name, state in completed.items():
+            yield _EMITTERS[node_name](state, turn, elapsed_ms)
+    else:
+        active_models = list(NODE_CONFIG.keys())
+        try:
+            async with asyncio.timeout_at(deadline_at):
+                history_summary = await _summarize_history(history)
+        except TimeoutError:
+            logger.warning("전체 마감 시간(%ss) 초과 - 이력 요약 중 중단", deadline_s)
+            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+            for partial in _deadline_partials(set(), turn, elapsed_ms, deadline_s):
+                yield partial
+            return
+        current_inputs = _build_current_inputs(question, history_summary, active_models)
+        conversation_history = list(history or [])
+        conversation_history.append({"role": "user", "content": question})
+        state_inputs = {
+            "question": question,
+            "max_turns": resolved_max_turns,
+            "turn": turn,
+            "conversation_history": conversation_history,
+            "history_summary": history_summary,
+            "current_inputs": current_inputs,
+            "active_models": active_models,
+            "first_only": first_only,
+        }
 
-    config = RunnableConfig(recursion_limit=20, configurable={"thread_id": str(create_uuid())})
     try:
-        async for event in app.astream(state_inputs, config=config):
-            turn_index = state_inputs.get("turn") or 1
-            for node_name, state in event.items():
-                if node_name == "__end__":
-                    continue
-                if node_name not in NODE_CONFIG:
+        # updates 모드는 노드가 반환한 상태 델타만 전달하므로 메시지도 새로 추가된 것만 정규화된다.
+        # custom 모드는 노드가 get_stream_writer()로 보낸 토큰 이벤트를 그대로 전달한다.
+        # first_only로 루프를 빠져나올 때 aclosing이 스트림을 즉시 닫아 남은 노드 태스크를 취소한다.
+        # 전체 마감 시간은 다음 이벤트를 기다리는 구간에만 적용해 yield 중인 소비자 쪽 대기는 취소하지 않는다.
+        # 재개한 실행에서 이미 완료된 모델은 다시 보내거나 마감 초과로 덮어쓰지 않는다.
+        finished: set[str] = set(completed)
+        async with contextlib.aclosing(
+            app.astream(state_inputs, config=config, stream_mode=["updates", "custom"])
+        ) as stream:
+            while True:
+                deadline_scope = asyncio.timeout_at(deadline_at)
+                try:
+                    async with deadline_scope:
+                        mode, chunk = await anext(stream)
+                except StopAsyncIteration:
+                    break
+                except TimeoutError:
+                    if not deadline_scope.expired():
+                        raise
+                    # 마감 시간이 지나면 스트림이 취소되며 남은 노드도 함께 취소된다. 미완료 모델은 상태로 보고한다.
+                    logger.warning("전체 마감 시간(%ss) 초과 - 미완료 모델 호출 취소", deadline_s)
+                    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+                    for partial in _deadline_partials(finished, turn, elapsed_ms, deadline_s):
+                        yield partial
+                    break
+                if mode == "custom":
+                    yield {**chunk, "turn": turn}
                     continue
-                meta = NODE_CONFIG[node_name]
-                logger.debug("이벤트 수신: %s (turn=%s)", meta["label"], turn_index)
-                elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-                yield {
-                    "model": meta["label"],
-                    "node": node_name,
-                    "answer": state.get(meta["answer_key"]),
-                    "status": state.get(meta["status_key"]) or {},
-                    "messages": _normalize_messages(state.get("messages")),
-                    "type": "partial",
-                    "turn": turn_index,
-                    "elapsed_ms": elapsed_ms,
-                }
+                for node_name, state in chunk.items():
+                    emit = _EMITTERS.get(node_name)
+                    if emit is None or node_name in finished:
+                        continue
+                    elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+                    partial = emit(state, turn, elapsed_ms)
+                    finished.add(node_name)
+                    logger.debug("이벤트 수신: %s (turn=%s)", partial["model"], turn)
+                    yield partial
+                    if first_only and partial["answer"]:
+                        logger.info("first_only - %s 응답 수신, 나머지 모델 호출 취소", partial["model"])
+                        return
     except Exception as exc:
         logger.error("LangGraph 스트림 오류: %s", exc)
         yield {
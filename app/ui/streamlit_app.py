@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
-import json
 import os
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 import streamlit as st
 
 from app.logger import get_logger
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+FASTAPI_URL_FILE = str(PROJECT_ROOT / ".fastapi_url")
+DEFAULT_API_URL = "http://127.0.0.1:8000/api/ask"
+
+
+@st.cache_data(show_spinner=False)
+def _read_api_url_file(mtime: float) -> str:
+    """`.fastapi_url` 파일 내용을 읽는다. 수정 시각(`mtime`)이 바뀔 때만 다시 읽는다."""
+
+    with open(FASTAPI_URL_FILE, encoding="utf-8") as file:
+        return file.read().strip()
 
 
 def load_api_url() -> str:
     """FastAPI 엔드포인트를 환경변수 → 파일 → 기본값 순으로 로드한다.
 
+    Streamlit은 재실행마다 스크립트를 다시 실행하므로 파일 내용은 `st.cache_data`에 보관하고
+    재실행 시에는 수정 시각만 확인한다.
+
     Returns:
         호출할 FastAPI `/api/ask` URL.
     """
@@ -25,14 +40,74 @@ def load_api_url() -> str:
     if env_value:
         return env_value
 
-    config_path = PROJECT_ROOT / ".fastapi_url"
-    if config_path.exists():
-        return config_path.read_text().strip()
-    return "http://127.0.0.1:8000/api/ask"
+    try:
+        mtime = os.path.getmtime(FASTAPI_URL_FILE)
+    except OSError:
+        return DEFAULT_API_URL
+    return _read_api_url_file(mtime)
+
+
+@st.cache_resource
+def get_http_client() -> httpx.Client:
+    """Streamlit 재실행 간에 공유하는 HTTP 클라이언트를 반환한다.
+
+    keep-alive 연결을 재사용해 질문마다 새 TCP/TLS 핸드셰이크를 하지 않는다.
+    """
+    return httpx.Client(
+        timeout=180.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+
+def iter_ndjson(response: httpx.Response) -> Iterator[dict[str, Any]]:
+    """스트림 응답 바이트를 줄 단위로 잘라 NDJSON 이벤트로 변환한다.
+
+    청크 경계가 레코드 경계와 일치하지 않아도(여러 레코드가 한 청크에 오거나 레코드가 쪼개져도)
+    줄바꿈이 도착한 레코드만 파싱한다.
+
+    Args:
+        response: `stream()`으로 연 httpx 응답.
+
+    Yields:
+        dict[str, Any]: 파싱된 이벤트.
+    """
+    buffer = bytearray()
+    for chunk in response.iter_bytes():
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                yield orjson.loads(line)
+        del buffer[:start]
+    if buffer.strip():
+        yield orjson.loads(buffer)
+
+
+def stream_events(payload: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """질문을 FastAPI로 전송하고 응답 스트림의 이벤트를 도착하는 대로 반환한다.
+
+    Args:
+        payload: `/api/ask` 요청 본문.
+
+    Yields:
+        dict[str, Any]: token/partial/summary/error 이벤트.
+
+    Raises:
+        httpx.HTTPStatusError: 서버가 오류 상태 코드로 응답한 경우.
+        httpx.RequestError: 연결/타임아웃 등 전송 오류가 발생한 경우.
+    """
+    with get_http_client().stream("POST", API_URL, json=payload) as response:
+        response.raise_for_status()
+        yield from iter_ndjson(response)
 
 
 API_URL = load_api_url()
 MAX_TURNS = 3
+RENDER_INTERVAL_S = 0.1
+ERROR_STATUSES = {"error", "timeout", "deadline_exceeded"}
 logger = get_logger(__name__)
 logger.info("Streamlit UI 초기화 - FastAPI URL: %s", API_URL)
 
@@ -49,39 +124,85 @@ if "partial_data" not in st.session_state:
     st.session_state.partial_data = {}
 if "partial_order" not in st.session_state:
     st.session_state.partial_order = []
+if "partial_rendered" not in st.session_state:
+    st.session_state.partial_rendered = {}
+if "primary_answer" not in st.session_state:
+    st.session_state.primary_answer = None
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
 
 
+def format_elapsed(elapsed_ms: int | None) -> str:
+    """소요 시간(ms)을 표시용 문자열로 변환한다. 1초 이상이면 초 단위로 표시한다."""
+
+    if elapsed_ms is None:
+        return "-"
+    if elapsed_ms >= 1000:
+        return f"{elapsed_ms/1000:.1f}s"
+    return f"{elapsed_ms}ms"
+
+
+def render_status_cell(status: dict[str, Any]) -> str:
+    """모델 호출 상태를 아이콘이 붙은 표 셀 문자열로 변환한다."""
+
+    code = status.get("status")
+    detail = status.get("detail")
+    text = f"{code} ({detail})" if detail else code
+    if code is None:
+        return "⚠️ -"
+    if str(code).lower() in ERROR_STATUSES or (isinstance(code, int) and code >= 400):
+        return f"❌ {text}"
+    if code in {"대기", "pending"}:
+        return f"⚠️ {text}"
+    return f"✅ {text}"
+
+
+def render_partial_entry(model: str, event: dict[str, Any]) -> str:
+    """모델 하나의 부분 결과를 Markdown 블록으로 변환한다."""
+
+    answer = event.get("answer") or "응답 없음"
+    status = event.get("status") or {}
+    status_text = render_status_cell({**status, "status": status.get("status") or "대기"})
+    elapsed = event.get("elapsed_ms")
+    if elapsed is not None:
+        status_text = f"{status_text} · {format_elapsed(elapsed)}"
+    return f"**{model}** — {status_text}\n\n{answer}"
+
+
+def update_partial(model: str, event: dict[str, Any]) -> None:
+    """모델의 부분 결과를 저장하고 해당 모델의 Markdown만 다시 렌더링해 캐싱한다."""
+
+    if model not in st.session_state.partial_order:
+        st.session_state.partial_order.append(model)
+    st.session_state.partial_data[model] = event
+    st.session_state.partial_rendered[model] = render_partial_entry(model, event)
+
+
+def reset_partials() -> None:
+    """부분 결과와 렌더링 캐시를 초기화한다."""
+
+    st.session_state.partial_data = {}
+    st.session_state.partial_order = []
+    st.session_state.partial_rendered = {}
+    st.session_state.primary_answer = None
+
+
 def render_partial_results() -> str:
-    """현재까지 수신한 부분 결과를 Markdown으로 변환한다."""
+    """현재까지 수신한 부분 결과를 Markdown으로 변환한다.
+
+    모델별 Markdown은 `update_partial()`에서 캐싱되므로 여기서는 순서대로 이어 붙이기만 한다.
+    최초 완료 모델의 답변이 도착했다면 나머지 모델을 기다리지 않고 가장 위에 먼저 보여준다.
+    """
 
     if not st.session_state.partial_data:
         return "LLM 응답을 기다리는 중입니다..."
 
-    lines: list[str] = []
-    for model in st.session_state.partial_order:
-        event = st.session_state.partial_data.get(model)
-        if not event:
-            continue
-        answer = event.get("answer") or "응답 없음"
-        status = event.get("status") or {}
-        status_code = status.get("status") or "대기"
-        detail = status.get("detail")
-        status_text = f"{status_code} ({detail})" if detail else status_code
-        if str(status_code).lower() in {"error"} or (isinstance(status_code, int) and status_code >= 400):
-            status_text = f"❌ {status_text}"
-        elif status_code not in {"대기", "pending"}:
-            status_text = f"✅ {status_text}"
-        elapsed = event.get("elapsed_ms")
-        if elapsed is not None:
-            if elapsed >= 1000:
-                time_text = f"{elapsed/1000:.1f}s"
-            else:
-                time_text = f"{elapsed}ms"
-            status_text = f"{status_text} · {time_text}"
-        lines.append(f"**{model}** — {status_text}\n\n{answer}")
-    return "\n\n---\n\n".join(lines)
+    rendered = st.session_state.partial_rendered
+    blocks = [rendered[model] for model in st.session_state.partial_order if model in rendered]
+    primary = st.session_state.primary_answer
+    if primary:
+        blocks.insert(0, f"### 최초 완료 모델: {primary.get('model')}\n\n{primary.get('answer') or '응답 없음'}")
+    return "\n\n---\n\n".join(blocks)
 
 
 def format_summary_message(result: dict[str, Any]) -> str:
@@ -104,38 +225,13 @@ def format_summary_message(result: dict[str, Any]) -> str:
     api_status = result.get("api_status") or {}
     durations = result.get("durations_ms") or {}
 
-    models = list(order)
-    for model_name in answers.keys():
-        if model_name not in models:
-            models.append(model_name)
-
-    def render_status_cell(status: dict[str, Any]) -> str:
-        code = status.get("status")
-        detail = status.get("detail")
-        text = f"{code} ({detail})" if detail else code
-        if code is None:
-            return "⚠️ -"
-        if str(code).lower() in {"error"} or (isinstance(code, int) and code >= 400):
-            return f"❌ {text}"
-        if code in {"대기", "pending"}:
-            return f"⚠️ {text}"
-        return f"✅ {text}"
+    models = list(dict.fromkeys([*order, *answers]))
 
     if models:
         header = "| 회사/모델명 | " + " | ".join(models) + " |"
         separator = "| --- | " + " | ".join(["---"] * len(models)) + " |"
-        status_row_cells = []
-        time_row_cells = []
-        for model_name in models:
-            status = api_status.get(model_name) or {}
-            status_row_cells.append(render_status_cell(status))
-            elapsed = durations.get(model_name)
-            if elapsed is None:
-                time_row_cells.append("-")
-            elif elapsed >= 1000:
-                time_row_cells.append(f"{elapsed/1000:.1f}s")
-            else:
-                time_row_cells.append(f"{elapsed}ms")
+        status_row_cells = [render_status_cell(api_status.get(model_name) or {}) for model_name in models]
+        time_row_cells = [format_elapsed(durations.get(model_name)) for model_name in models]
         status_row = "| 응답상태 | " + " | ".join(status_row_cells) + " |"
         time_row = "| 시간 | " + " | ".join(time_row_cells) + " |"
         lines.extend([header, separator, status_row, time_row])
@@ -143,16 +239,15 @@ def format_summary_message(result: dict[str, Any]) -> str:
     errors = result.get("errors") or []
     if errors:
         lines.append("### 오류")
-        for error in errors:
-            model = error.get("model") or "알 수 없음"
-            node = error.get("node") or "-"
-            message = error.get("message") or "메시지 없음"
-            lines.append(f"- **{model}** (노드: {node}): {message}")
+        lines.extend(
+            f"- **{error.get('model') or '알 수 없음'}** (노드: {error.get('node') or '-'}): "
+            f"{error.get('message') or '메시지 없음'}"
+            for error in errors
+        )
 
     if answers:
         lines.append("### 모델 응답")
-        for model_name, answer in answers.items():
-            lines.append(f"- **{model_name}**\n\n{answer or '응답 없음'}")
+        lines.extend(f"- **{model_name}**\n\n{answer or '응답 없음'}" for model_name, answer in answers.items())
 
     return "\n\n".join(lines)
 
@@ -165,36 +260,14 @@ def build_summary_table(result: dict[str, Any]) -> list[dict[str, str]]:
     durations = result.get("durations_ms") or {}
     order = result.get("order") or []
 
-    models: list[str] = list(order)
-    for model_name in answers.keys():
-        if model_name not in models:
-            models.append(model_name)
-
-    def render_status_cell(status: dict[str, Any]) -> str:
-        code = status.get("status")
-        detail = status.get("detail")
-        text = f"{code} ({detail})" if detail else code
-        if code is None:
-            return "⚠️ -"
-        if str(code).lower() in {"error"} or (isinstance(code, int) and code >= 400):
-            return f"❌ {text}"
-        if code in {"대기", "pending"}:
-            return f"⚠️ {text}"
-        return f"✅ {text}"
+    models: list[str] = list(dict.fromkeys([*order, *answers]))
 
     status_row: dict[str, str] = {"항목": "응답상태"}
     time_row: dict[str, str] = {"항목": "시간"}
 
     for model in models:
-        status = api_status.get(model) or {}
-        status_row[model] = render_status_cell(status)
-        elapsed = durations.get(model)
-        if elapsed is None:
-            time_row[model] = "-"
-        elif elapsed >= 1000:
-            time_row[model] = f"{elapsed/1000:.1f}s"
-        else:
-            time_row[model] = f"{elapsed}ms"
+        status_row[model] = render_status_cell(api_status.get(model) or {})
+        time_row[model] = format_elapsed(durations.get(model))
 
     return [status_row, time_row]
 
@@ -229,44 +302,47 @@ if prompt is not None:
             st.session_state.chat_history.append({"role": "user", "content": question})
             st.session_state.last_error = None
             st.session_state.last_result = None
-            st.session_state.partial_data = {}
-            st.session_state.partial_order = []
+            reset_partials()
             partial_placeholder.info("LLM 응답을 대기 중입니다.")
             try:
-                with httpx.stream(
-                    "POST",
-                    API_URL,
-                    json={
+                events = stream_events(
+                    {
                         "question": question,
                         "turn": current_turn,
                         "max_turns": MAX_TURNS,
                         "history": previous_history,
-                    },
-                    headers={"Content-Type": "application/json"},
-                    timeout=180.0,
-                ) as response:
-                    response.raise_for_status()
-                    for line in response.iter_text():
-                        if not line:
-                            continue
-                        event = json.loads(line)
-                        event_type = event.get("type", "partial")
-                        if event_type == "partial":
-                            model = event.get("model")
-                            if model and model not in st.session_state.partial_order:
-                                st.session_state.partial_order.append(model)
-                            if model:
-                                st.session_state.partial_data[model] = event
-                                logger.debug("부분 응답 갱신: %s", model)
-                            partial_placeholder.markdown(render_partial_results())
-                        elif event_type == "summary":
-                            st.session_state.last_result = event.get("result")
-                            logger.info("요약 이벤트 수신")
-                        elif event_type == "error":
-                            error_message = event.get("message", "알 수 없는 오류가 발생했습니다.")
-                            st.session_state.last_error = error_message
-                            logger.warning("오류 이벤트 수신: %s", error_message)
+                    }
+                )
+                last_render = 0.0
+                for event in events:
+                    event_type = event.get("type", "partial")
+                    if event_type == "token":
+                        model = event.get("model")
+                        if not model:
                             continue
+                        current = st.session_state.partial_data.get(model) or {"model": model, "answer": ""}
+                        current["answer"] = (current.get("answer") or "") + (event.get("delta") or "")
+                        update_partial(model, current)
+                    elif event_type == "partial":
+                        model = event.get("model")
+                        if model:
+                            update_partial(model, event)
+                            logger.debug("부분 응답 갱신: %s", model)
+                    elif event_type == "primary":
+                        st.session_state.primary_answer = event
+                        logger.debug("최초 완료 모델: %s", event.get("model"))
+                    elif event_type == "summary":
+                        st.session_state.last_result = event.get("result")
+                        logger.info("요약 이벤트 수신")
+                    elif event_type == "error":
+                        error_message = event.get("message", "알 수 없는 오류가 발생했습니다.")
+                        st.session_state.last_error = error_message
+                        logger.warning("오류 이벤트 수신: %s", error_message)
+                    # 토큰 이벤트는 초당 최대 1/RENDER_INTERVAL_S회만 다시 그린다.
+                    now = time.monotonic()
+                    if event_type != "token" or now - last_render >= RENDER_INTERVAL_S:
+                        partial_placeholder.markdown(render_partial_results())
+                        last_render = now
             except httpx.HTTPStatusError as http_error:
                 response = http_error.response
                 try:
@@ -301,8 +377,7 @@ if result:
         st.markdown(summary_markdown)
     st.session_state.chat_history.append({"role": "assistant", "content": summary_markdown})
     st.session_state.last_result = None
-    st.session_state.partial_data = {}
-    st.session_state.partial_order = []
+    reset_partials()
     partial_placeholder.empty()
     st.rerun()
 
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import os
-import subprocess
-import sys
 import threading
 from pathlib import Path
 
 import uvicorn
+from streamlit.web import bootstrap
 
 from app.config import get_settings
 from app.logger import get_logger
@@ -49,33 +48,28 @@ def ensure_streamlit_config() -> None:
         config_file.write_text("[browser]\ngatherUsageStats = false\n")
 
 
-def run_streamlit(port: int, env: dict[str, str]) -> None:
-    """지정된 포트에서 Streamlit 앱을 실행한다.
+def run_streamlit(port: int, headless: bool = True) -> None:
+    """지정된 포트에서 Streamlit 앱을 현재 프로세스 안에서 실행한다.
+
+    별도 인터프리터를 띄우지 않으므로 LLM SDK 등 이미 임포트한 모듈을 FastAPI와 공유한다.
+    Streamlit은 시그널 핸들러를 등록하므로 메인 스레드에서 호출해야 한다.
 
     Args:
         port: Streamlit 서버 포트.
-        env: subprocess에 전달할 환경변수 사본.
+        headless: 브라우저 자동 실행 없이 서버만 띄울지 여부.
 
     Returns:
         None
     """
     ensure_streamlit_config()
-    cmd = [
-        sys.executable,
-        "-m",
-        "streamlit",
-        "run",
-        str(STREAMLIT_SCRIPT),
-        "--server.port",
-        str(port),
-        "--server.headless=true",
-    ]
+    flag_options = {"server.port": port, "server.headless": headless}
+    bootstrap.load_config_options(flag_options=flag_options)
     logger.info("Streamlit 실행: 포트 %s", port)
-    subprocess.run(cmd, check=False, env=env)
+    bootstrap.run(str(STREAMLIT_SCRIPT), False, [], flag_options)
 
 
 def main() -> None:
-    """FastAPI와 Streamlit 프로세스를 함께 부트스트랩한다.
+    """FastAPI(백그라운드 스레드)와 Streamlit(메인 스레드)을 한 프로세스에서 함께 부트스트랩한다.
 
     Returns:
         None
@@ -93,12 +87,8 @@ def main() -> None:
     except OSError:
         pass
 
-    # 환경변수 설정 (subprocess에 전달하기 위해 os.environ 직접 수정)
+    # 같은 프로세스에서 실행되는 Streamlit 스크립트가 읽을 수 있도록 환경변수에도 설정
     os.environ["FASTAPI_URL"] = fastapi_url
-    os.environ["STREAMLIT_SERVER_PORT"] = str(streamlit_port)
-    os.environ["STREAMLIT_SERVER_HEADLESS"] = str(settings.streamlit_headless).lower()
-
-    env = os.environ.copy()
 
     api_thread = threading.Thread(
         target=run_fastapi,
@@ -113,7 +103,7 @@ def main() -> None:
     logger.info("FastAPI URL이 설정되었습니다: %s", fastapi_url)
 
     try:
-        run_streamlit(streamlit_port, env)
+        run_streamlit(streamlit_port, settings.streamlit_headless)
     except KeyboardInterrupt:
         logger.warning("사용자 중단 감지, Streamlit 종료")
 